@@ -5,6 +5,8 @@ import argparse
 import pprint
 import sys
 
+import numpy as np
+
 import mcio_ctrl as mcio
 from mcio_ctrl.envs import mcio_env
 
@@ -47,8 +49,8 @@ def tutorial(steps: int, instance_name: str | None, world_name: str | None) -> N
         elif cycle == 1:
             action["SPACE"] = mcio_env.NO_PRESS
 
-        # Limit some actions
-        action["cursor_delta"] = action["cursor_delta"].clip(-20, 20)
+        # Limit some actions. Clip in place rather than allocating a new array.
+        np.clip(action["cursor_delta"], -20, 20, out=action["cursor_delta"])
         action["E"] = mcio_env.NO_PRESS
         action["S"] = mcio_env.NO_PRESS
 
@@ -68,22 +70,21 @@ def print_step(
     action: mcio_env.MCioAction | None = None,
     observation: mcio_env.MCioObservation | None = None,
 ) -> None:
-    print(f"Step {step}:")
+    # Build the whole step and print it with a single write
+    lines = [f"Step {step}:"]
     if action is not None:
-        print(f"Action:\n{pprint.pformat(action)}")
+        lines.append(f"Action:\n{pprint.pformat(action)}")
     if observation is not None:
-        print(f"Obs:\n{obs_to_string(observation)}")
-    print("-" * 10)
+        lines.append(f"Obs:\n{obs_to_string(observation)}")
+    lines.append("-" * 10)
+    print("\n".join(lines))
 
 
 def obs_to_string(obs: mcio_env.MCioObservation) -> str:
     """Return a pretty version of the observation as a string.
     Prints the shape of the frame rather than the frame itself"""
-    frame = obs["frame"]
-    obs["frame"] = frame.shape
-    formatted = pprint.pformat(obs)
-    obs["frame"] = frame
-    return formatted
+    # Format a shallow copy so the caller's observation is never modified
+    return pprint.pformat({**obs, "frame": obs["frame"].shape})
 
 
 def parse_args() -> argparse.Namespace:
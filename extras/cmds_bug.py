@@ -36,10 +36,10 @@ def cmds(env: mcio_env.MCioEnv, commands: list[str]) -> None:
 
 
 def skipn(env: mcio_env.MCioEnv, steps: int) -> None:
+    # step() doesn't modify the action, so one noop serves every step
+    noop = env.get_noop_action()
     for i in range(steps):
-        observation, reward, terminated, truncated, info = env.step(
-            env.get_noop_action()
-        )
+        observation, reward, terminated, truncated, info = env.step(noop)
         time.sleep(0.1)
         print(f"Skip {i+1}")
 
@@ -47,10 +47,9 @@ def skipn(env: mcio_env.MCioEnv, steps: int) -> None:
 def skipx(env: mcio_env.MCioEnv) -> None:
     done = False
     i = 0
+    noop = env.get_noop_action()
     while not done:
-        observation, reward, terminated, truncated, info = env.step(
-            env.get_noop_action()
-        )
+        observation, reward, terminated, truncated, info = env.step(noop)
         i += 1
         key = input(f"{i}: Step? ")
         if key.lower() == "n":
@@ -2,41 +2,113 @@
 For testing. Prints received observation to console. Doesn't rely on mcio_ctrl at all.
 """
 
+import argparse
+import io
 import pprint
 import time
+from typing import IO, Any
 
 import cbor2
 import zmq
 
 OBSERVATION_PORT = 8001
 
+# CBOR major types and additional info values used by load_packet
+_CBOR_BYTE_STRING = 2
+_CBOR_MAP = 5
+_CBOR_INDEFINITE = 31
+_CBOR_BREAK = 0xFF
 
-def recv_loop() -> None:
+
+def _read_length(fp: IO[bytes], info: int) -> int:
+    """Read the argument of a CBOR item header given its additional info bits"""
+    if info < 24:
+        return info
+    n_bytes = 1 << (info - 24)  # 24-27 -> 1, 2, 4, 8 bytes
+    return int.from_bytes(fp.read(n_bytes), "big")
+
+
+def load_packet(pbytes: bytes) -> Any:
+    """Decode an observation packet, replacing the frame with its length.
+    The frame is skipped using the length in its CBOR header, so the frame
+    bytes are never copied into a Python object."""
+    if len(pbytes) == 0 or pbytes[0] >> 5 != _CBOR_MAP:
+        # Not a plain map, e.g. tagged. Decode it all and replace the frame after.
+        obj = cbor2.loads(pbytes)
+        if isinstance(obj, dict) and isinstance(obj.get("frame"), (bytes, bytearray)):
+            obj["frame"] = len(obj["frame"])
+        return obj
+
+    fp = io.BytesIO(pbytes)
+    decoder = cbor2.CBORDecoder(fp)
+    info = fp.read(1)[0] & 0x1F
+    n_items = None if info == _CBOR_INDEFINITE else _read_length(fp, info)
+
+    pkt: dict[Any, Any] = {}
+    while n_items is None or len(pkt) < n_items:
+        if n_items is None and pbytes[fp.tell()] == _CBOR_BREAK:
+            break
+        key = decoder.decode()
+        header = pbytes[fp.tell()]
+        if (
+            key == "frame"
+            and header >> 5 == _CBOR_BYTE_STRING
+            and header & 0x1F != _CBOR_INDEFINITE
+        ):
+            fp.seek(1, io.SEEK_CUR)
+            frame_len = _read_length(fp, header & 0x1F)
+            fp.seek(frame_len, io.SEEK_CUR)
+            pkt[key] = frame_len
+        else:
+            value = decoder.decode()
+            if key == "frame" and isinstance(value, (bytes, bytearray)):
+                # Indefinite-length frame, only decoded to find its end
+                value = len(value)
+            pkt[key] = value
+    return pkt
+
+
+def recv_loop(interval: int = 1) -> None:
     zmq_context = zmq.Context()
 
     # Socket to receive observation updates
     observation_socket = zmq_context.socket(zmq.PULL)
     observation_socket.connect(f"tcp://localhost:{OBSERVATION_PORT}")
 
-    start = time.time()
+    start_ns = time.monotonic_ns()
     pkt_count = 0
+    total_count = 0
     while True:
         pbytes = observation_socket.recv()
 
-        pkt = cbor2.loads(pbytes)
-        # The frame is too big to print, so replace with its length.
-        if "frame" in pkt:
-            pkt["frame"] = len(pkt["frame"])
-        pprint.pprint(pkt)
+        # pprint is slow enough to limit PPS, so only print every interval packets.
+        pkt_count += 1
+        total_count += 1
+        if interval > 0 and total_count % interval == 0:
+            # The frame is too big to print, so it's replaced with its length.
+            pkt = load_packet(pbytes)
+            pprint.pprint(pkt)
 
         # Print a PPS rate every second.
-        end = time.time()
-        pkt_count += 1
-        if end - start >= 1:
-            print(f"PPS = {pkt_count / (end - start):.1f}")
+        end_ns = time.monotonic_ns()
+        if end_ns - start_ns >= 1_000_000_000:
+            print(f"PPS = {pkt_count * 1e9 / (end_ns - start_ns):.1f}")
             pkt_count = 0
-            start = end
+            start_ns = end_ns
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Print received observations")
+    parser.add_argument(
+        "--interval",
+        "-n",
+        type=int,
+        default=1,
+        help="Print every Nth observation. 0 only prints PPS",
+    )
+    return parser.parse_args()
 
 
 if __name__ == "__main__":
-    recv_loop()
+    args = parse_args()
+    recv_loop(args.interval)
@@ -16,8 +16,10 @@ from tqdm import tqdm
 import mcio_ctrl as mcio
 from mcio_ctrl.envs import minerl_env
 
+tqdm.monitor_interval = 0  # No monitor thread waking during the timed loop
 
-def mcio_setup(render: bool, connect: bool) -> Any:
+
+def mcio_setup(render: bool, connect: bool) -> minerl_env.MinerlEnv:
     if connect:
         # To launch an instance:
         #  mcio inst launch DemoInstance -m sync -w DemoWorld -W 640 -H 360
@@ -40,16 +42,12 @@ def mcio_setup(render: bool, connect: bool) -> Any:
 
 
 def mcio_run(
-    env: Any,
+    env: minerl_env.MinerlEnv,
     num_steps: int,
     render: bool,
     render_n: int | None,
     steps_completed: list[int],
 ) -> None:
-    from mcio_ctrl.envs import minerl_env
-
-    assert isinstance(env, minerl_env.MinerlEnv)
-
     action: dict[str, Any] = defaultdict(
         int
     )  # This will return 0 for any unspecified key
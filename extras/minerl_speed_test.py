@@ -16,6 +16,8 @@ import gym  # type: ignore
 import minerl  # type: ignore # noqa: F401  # needed for gym registration
 from tqdm import tqdm
 
+tqdm.monitor_interval = 0  # No monitor thread waking during the timed loop
+
 
 def minerl_setup() -> Any:
     # logging.basicConfig(level=logging.DEBUG)
@@ -20,6 +20,8 @@ import mcio_ctrl as mcio
 
 LOG = logging.getLogger(__name__)
 
+tqdm.monitor_interval = 0  # No monitor thread waking during the timed loop
+
 
 class SpeedTest:
 
@@ -61,8 +63,11 @@ class SpeedTest:
 
         # Time the generate action / process observation loop
         self.counter = mcio.util.TrackPerSecond("SpeedTestPPS")
+        # The action is always empty, so reuse one packet. send_action() only
+        # updates its sequence.
+        action = mcio.network.ActionPacket()
         for i in tqdm(count() if self.steps is None else range(self.steps)):
-            self.ctrl.send_action(mcio.network.ActionPacket())
+            self.ctrl.send_action(action)
 
             obs_recv = self.ctrl.recv_observation()
             if self.process_frames:
@@ -99,8 +104,13 @@ class GenerateObservation(mcio.mc_mock.GenerateObservation):
         self.base_obs.frame_height = height
         self.base_obs.frame_width = width
         frame_size = height * width * 3
-        self.frame_array = np.zeros((frame_size,), dtype=np.uint8)
-        self.base_obs.frame = self.frame_array.tobytes()
+        # frame_array is a view of the frame buffer, so updates to it are sent
+        # without copying the whole frame with tobytes() every step.
+        # cbor2 encodes a bytearray the same as bytes. The packet aliases frame_buf,
+        # so writes to frame_array change what the next send carries.
+        frame_buf = bytearray(frame_size)
+        self.frame_array = np.frombuffer(frame_buf, dtype=np.uint8)
+        self.base_obs.frame = frame_buf
         self.base_obs.frame_type = mcio.types.FrameType.RAW
 
     def generate_observation(self) -> mcio.network.ObservationPacket:
@@ -111,7 +121,6 @@ class GenerateObservation(mcio.mc_mock.GenerateObservation):
             # so it doesn't matter in that case)
             self.frame_array[self.obs_sequence % self.frame_array.size] = 0xFF
             self.obs_sequence += 1
-            self.base_obs.frame = self.frame_array.tobytes()
         return self.base_obs
 
 
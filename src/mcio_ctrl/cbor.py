@@ -15,6 +15,15 @@ MCIO_PROTOCOL_TYPE: Final[str] = "__mcio_type__"
 _MCIO_NAME_TO_TYPE: dict[str, type] = {}
 _MCIO_TYPE_TO_NAME: dict[type, str] = {}
 
+# Field names of each dataclass seen by typed_asdict. fields() rebuilds its
+# tuple on every call, and packets are encoded on every send.
+_FIELD_NAMES: dict[type, tuple[str, ...]] = {}
+
+# Leaf types typed_asdict returns unchanged. Checked first since most values are leaves.
+_SCALAR_TYPES: Final[frozenset[type]] = frozenset(
+    {int, float, str, bool, bytes, bytearray, type(None)}
+)
+
 
 T = TypeVar("T")
 
@@ -60,13 +69,16 @@ def typed_asdict(obj: Any) -> Any:
     """Like dataclass asdict, but annotates MCioType classes with type info.
     Recursively walks the dataclass.
     """
-    if is_dataclass(obj):
-        cls = type(obj)
+    cls = type(obj)
+    if cls in _SCALAR_TYPES:
+        return obj
+    elif is_dataclass(obj):
+        field_names = _FIELD_NAMES.get(cls)
+        if field_names is None:
+            field_names = tuple(f.name for f in fields(obj))
+            _FIELD_NAMES[cls] = field_names
         cls_name = _MCIO_TYPE_TO_NAME.get(cls)
-        result = {
-            key: typed_asdict(getattr(obj, key))
-            for key in (f.name for f in fields(obj))
-        }
+        result = {key: typed_asdict(getattr(obj, key)) for key in field_names}
         if cls_name:
             result[MCIO_PROTOCOL_TYPE] = cls_name
         return result
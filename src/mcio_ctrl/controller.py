@@ -161,9 +161,9 @@ class ControllerAsync(ControllerCommon):
         LOG.info("ObservationThread start")
         while self._running.is_set():
             # RECV 1
-            # I don't think we'll ever drop here. this is a short loop to recv the packet
-            # and put it on the queue to be processed.
-            observation = self._mcio_conn.recv_observation(block=True)
+            # Only the most recent observation is kept, so if several are waiting
+            # skip straight to the newest rather than decoding each one.
+            observation = self._mcio_conn.recv_observation(block=True, latest=True)
             if observation is None:
                 continue  # Exiting or packet decode error
 
@@ -81,13 +81,13 @@ class InputStateManager:
         # Build sets of which InputIDs are pressed or not
         pressed_set: set[types.InputID] = set()
         released_set: set[types.InputID] = set()
-        for action_name, action_val in action.items():
-            if action_name not in input_map:
-                # The action will contain non-key/button fields
+        # Walk input_map so non-key/button action fields are never visited
+        for action_name, input_id in input_map.items():
+            action_val = action.get(action_name)
+            if action_val is None:
                 continue
-            input_id = input_map[action_name]
             # action_val is Discrete(2), so either np.int64(0) or np.int64(1)
-            if bool(action_val):
+            if action_val:
                 pressed_set.add(input_id)
             else:
                 released_set.add(input_id)
@@ -131,7 +131,5 @@ class StatsCache(defaultdict[str, defaultdict[str, int]]):
 
 def nf32(seq: Sequence[int | float] | int | float) -> NDArray[np.float32]:
     """Convert sequences or single values to np.float32 arrays. Turns single values into 1D arrays."""
-    if isinstance(seq, (int, float)):
-        seq = [float(seq)]
-    arr = np.array([float(val) for val in seq], dtype=np.float32)
-    return arr
+    # np.array always copies, so observations never alias the packet data.
+    return np.array(seq, dtype=np.float32, ndmin=1)
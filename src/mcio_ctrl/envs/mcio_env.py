@@ -53,6 +53,9 @@ INPUT_MAP: dict[str, InputID] = {
 CURSOR_DELTA_ZERO = np.array((0.0, 0.0), dtype=np.int32)
 CURSOR_DELTA_ZERO.flags.writeable = False
 
+# Key / button part of the noop action. get_noop_action() copies this.
+_NOOP_INPUTS: dict[str, np.int64] = {name: NO_PRESS for name in INPUT_MAP}
+
 
 class MCioEnv(MCioBaseEnv[MCioObservation, MCioAction]):
     # The maximum change measured in pixels
@@ -135,10 +138,7 @@ class MCioEnv(MCioBaseEnv[MCioObservation, MCioAction]):
 
         return packet
 
-    # Is there a better way to do this?
     def get_noop_action(self) -> MCioAction:
-        action: MCioAction = {}
-        for name in INPUT_MAP.keys():
-            action[name] = NO_PRESS
+        action: MCioAction = dict(_NOOP_INPUTS)
         action["cursor_delta"] = CURSOR_DELTA_ZERO.copy()
         return action
@@ -3,6 +3,8 @@ ImageStreamGui class for displaying frames in a window using glfw and opengl.
 Used for gym render.
 """
 
+import ctypes
+import math
 import time
 from typing import Any, Callable
 
@@ -45,10 +47,26 @@ class ImageStreamGui:
         self.frame_width = 0
         self.frame_height = 0
         self.scale = scale
+        # Window size from the last resize event, applied by the next render
+        self._pending_viewport: tuple[int, int] | None = None
+
+        # Persistent texture for frame uploads. Storage is allocated on the first
+        # frame and reallocated only when the frame size changes.
+        self.texture = self._texture_init()
+        self._texture_width = 0
+        self._texture_height = 0
+
+        # Static vertex buffer for the full window quad
+        self.quad_vbo = self._quad_init()
 
     def poll(self) -> None:
         glfw.poll_events()  # Poll for events
 
+    def wait(self, timeout: float) -> None:
+        """Sleep until an event arrives or timeout seconds pass. Events are
+        processed as in poll(), so input is handled while waiting."""
+        glfw.wait_events_timeout(timeout)
+
     def show(self, frame: NDArray[np.uint8], poll: bool = True) -> bool:
         """Display the next frame
         Args:
@@ -108,8 +126,15 @@ class ImageStreamGui:
         """Set the cursor mode. Minecraft uses glfw.CURSOR_NORMAL (212993) and glfw.CURSOR_DISABLED (212995)"""
         glfw.set_input_mode(self.window, glfw.CURSOR, mode)
 
+    def set_swap_interval(self, interval: int) -> None:
+        """Set the number of screen refreshes to wait before swapping buffers.
+        1 enables vsync, 0 disables it."""
+        glfw.swap_interval(interval)
+
     def close(self) -> None:
         """Clean up resources"""
+        gl.glDeleteBuffers(1, [self.quad_vbo])
+        gl.glDeleteTextures([self.texture])
         glfw.set_window_should_close(self.window, True)
         glfw.terminate()
 
@@ -138,9 +163,9 @@ class ImageStreamGui:
 
     def default_resize_callback(self, window: Any, width: int, height: int) -> None:
         """Handle window resize"""
-        gl.glViewport(0, 0, width, height)
-        # Force a redraw
-        glfw.post_empty_event()
+        # Dragging a window edge can fire many resize events between frames.
+        # Just record the latest size. The viewport is updated on the next render.
+        self._pending_viewport = (width, height)
 
     def default_focus_callback(self, window: Any, focused: int) -> None:
         """Handle focus change Note: focused is 0 or 1"""
@@ -166,12 +191,56 @@ class ImageStreamGui:
         # Set up OpenGL context
         glfw.make_context_current(window)
 
-        if not vsync:
-            # Disable vsync to avoid frame rate limiting
-            glfw.swap_interval(0)
+        # vsync paces swap_buffers to the display refresh. Disable it to avoid
+        # frame rate limiting.
+        glfw.swap_interval(1 if vsync else 0)
 
         return window
 
+    def _texture_init(self) -> Any:
+        texture = gl.glGenTextures(1)
+        gl.glBindTexture(gl.GL_TEXTURE_2D, texture)
+        # Set texture parameters for scaling down/up
+        gl.glTexParameteri(gl.GL_TEXTURE_2D, gl.GL_TEXTURE_MIN_FILTER, gl.GL_NEAREST)
+        gl.glTexParameteri(gl.GL_TEXTURE_2D, gl.GL_TEXTURE_MAG_FILTER, gl.GL_NEAREST)
+        # RGB rows aren't 4 byte aligned in general. This is context state, so it
+        # only needs to be set once.
+        gl.glPixelStorei(gl.GL_UNPACK_ALIGNMENT, 1)
+        return texture
+
+    def _quad_init(self) -> Any:
+        """Set up a quad that fills the window. The vertices are uploaded once and
+        the vertex state is left enabled, so each frame is a single glDrawArrays."""
+        # Interleaved (x, y, u, v) for a triangle strip. Positions go from -1 to 1
+        # (OpenGL normalized coordinates). The v coordinate is flipped so the top
+        # row of the frame is drawn at the top.
+        vertices = np.array(
+            [
+                [-1, -1, 0, 1],
+                [1, -1, 1, 1],
+                [-1, 1, 0, 0],
+                [1, 1, 1, 0],
+            ],
+            dtype=np.float32,
+        )
+        stride = vertices.strides[0]
+        vbo = gl.glGenBuffers(1)
+        gl.glBindBuffer(gl.GL_ARRAY_BUFFER, vbo)
+        gl.glBufferData(
+            gl.GL_ARRAY_BUFFER, vertices.nbytes, vertices, gl.GL_STATIC_DRAW
+        )
+        # The pointers capture the bound buffer, so it can be unbound after.
+        gl.glVertexPointer(2, gl.GL_FLOAT, stride, ctypes.c_void_p(0))
+        gl.glTexCoordPointer(
+            2, gl.GL_FLOAT, stride, ctypes.c_void_p(2 * vertices.itemsize)
+        )
+        gl.glBindBuffer(gl.GL_ARRAY_BUFFER, 0)
+        gl.glEnableClientState(gl.GL_VERTEX_ARRAY)
+        gl.glEnableClientState(gl.GL_TEXTURE_COORD_ARRAY)
+        # Texture mapping is the only thing drawn, so leave it enabled.
+        gl.glEnable(gl.GL_TEXTURE_2D)
+        return vbo
+
     def _render(self, frame: NDArray[np.uint8]) -> None:
         """glfw portion of render"""
         self._auto_resize(frame)
@@ -192,58 +261,52 @@ class ImageStreamGui:
 
     def _render_gl(self, frame: NDArray[np.uint8]) -> None:
         """opengl portion of render"""
+        if self._pending_viewport is not None:
+            gl.glViewport(0, 0, *self._pending_viewport)
+            self._pending_viewport = None
         gl.glClearColor(0.0, 0.0, 0.0, 1.0)
         gl.glClear(gl.GL_COLOR_BUFFER_BIT)
-        gl.glPixelStorei(gl.GL_UNPACK_ALIGNMENT, 1)
 
-        # Prepare frame for opengl
-        frame = np.flipud(np.array(frame))
+        # Frames are top-down while OpenGL textures are bottom-up. Rather than
+        # flipping the frame on the CPU, the texture coordinates below are flipped.
+        # ascontiguousarray is a no-op for the usual contiguous frames.
         frame = np.ascontiguousarray(frame)
 
-        # Create and bind texture
-        texture = gl.glGenTextures(1)
-        gl.glBindTexture(gl.GL_TEXTURE_2D, texture)
-
-        # Set texture parameters for scaling down/up
-        gl.glTexParameteri(gl.GL_TEXTURE_2D, gl.GL_TEXTURE_MIN_FILTER, gl.GL_NEAREST)
-        gl.glTexParameteri(gl.GL_TEXTURE_2D, gl.GL_TEXTURE_MAG_FILTER, gl.GL_NEAREST)
-
-        # Upload the image to texture
+        # Upload the image to the texture
         # shape = (height, width, channels)
         height = frame.shape[0]
         width = frame.shape[1]
-        gl.glTexImage2D(
-            gl.GL_TEXTURE_2D,
-            0,
-            gl.GL_RGB,
-            width,
-            height,
-            0,
-            gl.GL_RGB,
-            gl.GL_UNSIGNED_BYTE,
-            frame,
-        )
-
-        # Enable texture mapping
-        gl.glEnable(gl.GL_TEXTURE_2D)
+        gl.glBindTexture(gl.GL_TEXTURE_2D, self.texture)
+        if width != self._texture_width or height != self._texture_height:
+            # First frame or size change. (Re)allocate the texture storage.
+            self._texture_width = width
+            self._texture_height = height
+            gl.glTexImage2D(
+                gl.GL_TEXTURE_2D,
+                0,
+                gl.GL_RGB8,  # Sized format rather than letting the driver choose
+                width,
+                height,
+                0,
+                gl.GL_RGB,
+                gl.GL_UNSIGNED_BYTE,
+                frame,
+            )
+        else:
+            gl.glTexSubImage2D(
+                gl.GL_TEXTURE_2D,
+                0,
+                0,
+                0,
+                width,
+                height,
+                gl.GL_RGB,
+                gl.GL_UNSIGNED_BYTE,
+                frame,
+            )
 
-        # Draw a quad (rectangle made of two triangles) that fills the screen
-        # The quad goes from -1 to 1 in both x and y (OpenGL normalized coordinates)
-        gl.glBegin(gl.GL_QUADS)
-        # For each vertex, set texture coordinate (0-1) and vertex position (-1 to 1)
-        gl.glTexCoord2f(0, 0)
-        gl.glVertex2f(-1, -1)
-        gl.glTexCoord2f(1, 0)
-        gl.glVertex2f(1, -1)
-        gl.glTexCoord2f(1, 1)
-        gl.glVertex2f(1, 1)
-        gl.glTexCoord2f(0, 1)
-        gl.glVertex2f(-1, 1)
-        gl.glEnd()
-
-        # Clean up
-        gl.glDisable(gl.GL_TEXTURE_2D)
-        gl.glDeleteTextures([texture])
+        # Draw the quad set up in _quad_init()
+        gl.glDrawArrays(gl.GL_TRIANGLE_STRIP, 0, 4)
 
 
 class TestPattern:
@@ -260,14 +323,19 @@ class TestPattern:
     def get_frame(self) -> NDArray[np.uint8]:
         # Create image with background color
         color = self.cycle_spectrum(self.step, self.frequency)
-        frame = np.full((self.height, self.width, 3), color, dtype=np.uint8)
+        frame = np.empty((self.height, self.width, 3), dtype=np.uint8)
+        # Broadcasting the 3 byte color over the whole frame (np.full) is slow.
+        # Fill one row, then copy that row to the rest of the frame.
+        if self.height > 0:
+            frame[0] = color
+            frame[1:] = frame[0]
         self.step += 1
         return frame
 
     def sin(self, x: int, frequency: float, phase_shift: float) -> float:
         # sin from 0 to 255. phase shift is fraction of 2*pi.
-        val: float = 127.5 * (np.sin(frequency * x + (phase_shift * 2 * np.pi)) + 1)
-        return val
+        # math.sin since this is a scalar. np.sin has ufunc dispatch overhead.
+        return 127.5 * (math.sin(frequency * x + (phase_shift * 2 * math.pi)) + 1)
 
     def cycle_spectrum(self, step: int, frequency: float = 0.1) -> NDArray[np.uint8]:
         """
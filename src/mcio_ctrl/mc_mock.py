@@ -4,7 +4,7 @@ import enum
 import logging
 import multiprocessing as mp
 import os
-from typing import Any
+from typing import Any, Callable
 
 import zmq
 
@@ -43,13 +43,17 @@ class _SocketProcessor(mp.Process):
         name = mp.current_process().name
         LOG.info(f"Starting-Subprocess name={name} pid={os.getpid()}")
 
+        # Pick the per-message handler once rather than matching on every message
+        process: Callable[[zmq.SyncSocket], None]
         match self._process_type:
             case self.ProcessType.OBSERVATION:
                 socket_type = zmq.PUSH
                 port = types.DEFAULT_OBSERVATION_PORT
+                process = self._process_observation
             case self.ProcessType.ACTION:
                 socket_type = zmq.PULL
                 port = types.DEFAULT_ACTION_PORT
+                process = self._process_action
             case _:
                 raise ValueError(f"Invalid process type: {self._process_type}")
 
@@ -60,7 +64,7 @@ class _SocketProcessor(mp.Process):
         try:
             while True:
                 try:
-                    self._process(socket)
+                    process(socket)
                 except Exception as e:
                     LOG.error(f"Error in process loop: {e}")
         except KeyboardInterrupt:
@@ -70,16 +74,15 @@ class _SocketProcessor(mp.Process):
             socket.close()
             context.term()
 
-    def _process(self, socket: zmq.SyncSocket) -> None:
-        match self._process_type:
-            case self.ProcessType.OBSERVATION:
-                obs = self.generate_observation()
-                socket.send(obs.pack())
-            case self.ProcessType.ACTION:
-                pbytes = socket.recv()
-                act = network.ActionPacket.unpack(pbytes)
-                assert act is not None
-                self.process_action(act)
+    def _process_observation(self, socket: zmq.SyncSocket) -> None:
+        obs = self.generate_observation()
+        socket.send(obs.pack())
+
+    def _process_action(self, socket: zmq.SyncSocket) -> None:
+        pbytes = socket.recv()
+        act = network.ActionPacket.unpack(pbytes)
+        assert act is not None
+        self.process_action(act)
 
     def initialize(self, options: dict[Any, Any] | None) -> None:
         raise NotImplementedError()
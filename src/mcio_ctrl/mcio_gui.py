@@ -4,10 +4,13 @@ mouse actions are sent to Minecraft, and the observation screenshots are
 displayed.
 """
 
+import contextlib
+import ctypes
 import logging
 import queue
+import sys
 import time
-from typing import Any, Callable, Sequence
+from typing import Any, Callable, Iterator, Sequence
 
 import glfw  # type: ignore
 import numpy as np
@@ -35,6 +38,21 @@ def cursor_frame_cb(frame: NDArray[np.uint8], obs: network.ObservationPacket) ->
 DEFAULT_FRAME_PIPELINE: FramePipeline = (cursor_frame_cb,)
 
 
+@contextlib.contextmanager
+def _timer_resolution(period_ms: int = 1) -> Iterator[None]:
+    """Timed waits on Windows default to ~15.6 ms granularity, which is coarser
+    than a 60 fps frame. Raise the system timer resolution while in the context.
+    Does nothing on other platforms."""
+    if sys.platform != "win32":
+        yield
+        return
+    ctypes.windll.winmm.timeBeginPeriod(period_ms)
+    try:
+        yield
+    finally:
+        ctypes.windll.winmm.timeEndPeriod(period_ms)
+
+
 class MCioGUI:
     """
     Usage: Start a Minecraft instance using instance.py.
@@ -51,16 +69,25 @@ class MCioGUI:
         action_port: int | None = None,
         observation_port: int | None = None,
         frame_pipeline: FramePipeline = DEFAULT_FRAME_PIPELINE,
+        vsync: bool = False,
     ):
         self.scale = scale
         self.fps = fps if fps > 0 else 60
+        self.vsync = vsync
         self.running = True
         self.gui: gui.ImageStreamGui | None = None
-        self.gui = gui.ImageStreamGui(name, scale=scale, width=800, height=600)
+        self.gui = gui.ImageStreamGui(
+            name, scale=scale, width=800, height=600, vsync=vsync
+        )
         self.controller = controller.ControllerAsync(
             action_port=action_port, observation_port=observation_port
         )
         self.frame_pipeline = frame_pipeline
+        # Reused for each displayed frame. Allocated on the first frame.
+        self._frame_buf: NDArray[np.uint8] | None = None
+        # Input events from the callbacks are collected here and sent as a
+        # single ActionPacket once per loop. See send_pending_action().
+        self._pending_action: network.ActionPacket | None = None
 
         # Set callbacks. Defaults are good enough for resize and focus.
         self.gui.set_callbacks(
@@ -83,8 +110,7 @@ class MCioGUI:
 
         # Pass everything else to Minecraft
         input = types.InputEvent.from_ints(types.InputType.KEY, key, action)
-        action_pkt = network.ActionPacket(inputs=[input])
-        self.controller.send_action(action_pkt)
+        self._queue_input(input)
 
     def cursor_position_callback(self, window: Any, xpos: float, ypos: float) -> None:
         """Handle mouse movement. Only watch the mouse when we're focused."""
@@ -94,30 +120,58 @@ class MCioGUI:
             # XXX If the user manually resizes the window, the scaling goes out of whack.
             # Need to change the scale based on actual window size vs frame size
             scaled_pos = (int(xpos / self.scale), int(ypos / self.scale))
-            action = network.ActionPacket(cursor_pos=[scaled_pos])
-            self.controller.send_action(action)
+            # Send pending inputs first so they keep the position they happened at.
+            if self._pending_action is not None and self._pending_action.inputs:
+                self.send_pending_action()
+            # Minecraft works from the latest position, so intermediate positions
+            # between inputs don't need to be sent.
+            self._get_pending_action().cursor_pos = [scaled_pos]
 
     def mouse_button_callback(
         self, window: Any, button: int, action: int, mods: int
     ) -> None:
         """Handle mouse button events"""
         input = types.InputEvent.from_ints(types.InputType.MOUSE, button, action)
-        action_pkt = network.ActionPacket(inputs=[input])
-        self.controller.send_action(action_pkt)
-
-    def show(self, observation: network.ObservationPacket) -> None:
-        """Show frame to the user"""
+        self._queue_input(input)
+
+    def _queue_input(self, input: types.InputEvent) -> None:
+        # A packet doesn't record whether its inputs or cursor positions came
+        # first, so send any pending cursor movement before queueing the input.
+        if self._pending_action is not None and self._pending_action.cursor_pos:
+            self.send_pending_action()
+        self._get_pending_action().inputs.append(input)
+
+    def _get_pending_action(self) -> network.ActionPacket:
+        if self._pending_action is None:
+            self._pending_action = network.ActionPacket()
+        return self._pending_action
+
+    def send_pending_action(self) -> None:
+        """Send the input collected by the callbacks since the last call, if any.
+        Fast mouse movement can generate hundreds of callbacks a second, so they're
+        batched into one packet per loop rather than sent one at a time. The
+        callbacks send early when switching between inputs and cursor movement so
+        events stay in order."""
+        if self._pending_action is not None:
+            self.controller.send_action(self._pending_action)
+            self._pending_action = None
+
+    def show(self, observation: network.ObservationPacket) -> bool:
+        """Show frame to the user. Returns True if a frame was displayed."""
         if observation.frame:
             # Link cursor mode to Minecraft.
             assert self.gui is not None
             self.gui.set_cursor_mode(observation.cursor_mode)
-            frame = observation.get_frame()
+            frame = observation.get_frame(out=self._frame_buf)
+            self._frame_buf = frame
             for pipeline_cb in self.frame_pipeline:
                 rv = pipeline_cb(frame, observation)
                 if isinstance(rv, np.ndarray):
                     frame = rv
 
             self.gui.show(frame, poll=False)
+            return True
+        return False
 
     def run(self, launcher: instance.Launcher | None = None) -> None:
         """Main application loop
@@ -126,32 +180,50 @@ class MCioGUI:
         assert self.gui is not None
         frame_time = 1.0 / self.fps
         fps_track = util.TrackPerSecond("FPS")
-        while self.running:
-            frame_start = time.perf_counter()
-            try:
-                observation = self.controller.recv_observation(block=False)
-            except queue.Empty:
-                # No new frame. Just poll gui and continue.
-                pass
-            else:
-                LOG.debug(observation)
-                self.show(observation)
-
-            # Always poll. This keeps the window from being frozen.
-            self.gui.poll()
-
-            if launcher is not None:
-                ret = launcher.poll()
-                if ret is not None:
-                    # Minecraft exited
-                    self.running = False
-
-            # Calculate sleep time to maintain target FPS
-            elapsed = time.perf_counter() - frame_start
-            sleep_time = max(0, frame_time - elapsed)
-            if sleep_time > 0:
-                time.sleep(sleep_time)
-            fps_track.count()
+        next_frame = time.perf_counter()
+        with _timer_resolution():
+            while self.running:
+                next_frame += frame_time
+                shown = False
+                try:
+                    observation = self.controller.recv_observation(block=False)
+                except queue.Empty:
+                    # No new frame. Just poll gui and continue.
+                    pass
+                else:
+                    LOG.debug(observation)
+                    shown = self.show(observation)
+
+                # Always poll. This keeps the window from being frozen.
+                # Polling runs the input callbacks, so send what they collected.
+                self.gui.poll()
+                self.send_pending_action()
+
+                if launcher is not None:
+                    ret = launcher.poll()
+                    if ret is not None:
+                        # Minecraft exited
+                        self.running = False
+
+                # With vsync, swap_buffers already waited for the display refresh.
+                # Otherwise wait until the next frame deadline. Waiting to a fixed
+                # deadline rather than for frame_time - elapsed keeps overshoot
+                # from accumulating and dragging the frame rate below the target.
+                # Input events wake the wait and are handled as they arrive. Their
+                # actions are sent after the next poll.
+                if self.vsync and shown:
+                    # Re-anchor so a display faster than fps doesn't build up a
+                    # deadline far in the future.
+                    next_frame = time.perf_counter()
+                else:
+                    wait_time = next_frame - time.perf_counter()
+                    if wait_time <= 0:
+                        # Running behind. Don't try to catch up with a burst of frames.
+                        next_frame = time.perf_counter()
+                    while wait_time > 0:
+                        self.gui.wait(wait_time)
+                        wait_time = next_frame - time.perf_counter()
+                fps_track.count()
 
         # Cleanup
         LOG.info("Exiting...")
@@ -43,7 +43,9 @@ class ObservationPacket:
     frame_sequence: int = 0  # Frame number since Minecraft started
 
     ## Observation ##
-    frame: bytes = field(repr=False, default=b"")  # Exclude the frame from repr output.
+    # Exclude the frame from repr output. Received frames are always bytes. Senders
+    # such as mc_mock can use a bytearray to update the frame in place.
+    frame: bytes | bytearray = field(repr=False, default=b"")
     frame_width: int = 0
     frame_height: int = 0
     frame_type: types.FrameType = types.FrameType.RAW
@@ -95,20 +97,29 @@ class ObservationPacket:
             return None
         return cast(T, rv)
 
-    def get_frame(self) -> NDArray[np.uint8]:
-        """Get the frame from the observation. Returns as a mutable numpy array"""
+    def get_frame(self, out: NDArray[np.uint8] | None = None) -> NDArray[np.uint8]:
+        """Get the frame from the observation. Returns as a mutable numpy array
+        If out is passed and matches the frame shape, the frame is copied into out
+        and out is returned. Otherwise a new array is allocated. Use out to reuse
+        a buffer across frames."""
         assert self.frame_type == types.FrameType.RAW
         frame: NDArray[np.uint8] = np.frombuffer(self.frame, dtype=np.uint8)
         frame = frame.reshape((self.frame_height, self.frame_width, 3))
         frame = np.flipud(frame)  # OpenGL frames are flipped
+        if out is not None and out.shape == frame.shape:
+            np.copyto(out, frame)
+            return out
         # cbor2 returns a non-mutable bytes object. Copy to make it mutable.
         frame = frame.copy()
         return frame
 
     def get_frame_with_cursor(
-        self, cursor_drawer: util.CursorDrawer | None = None
+        self,
+        cursor_drawer: util.CursorDrawer | None = None,
+        out: NDArray[np.uint8] | None = None,
     ) -> NDArray[np.uint8]:
-        frame = self.get_frame()
+        """Get the frame with the cursor drawn on it. See get_frame() for out."""
+        frame = self.get_frame(out=out)
         if cursor_drawer is None:
             cursor_drawer = util.DEFAULT_CURSOR_DRAWER
         cursor_drawer.draw_cursor_check(frame, self.cursor_pos, self.cursor_mode)
@@ -175,6 +186,10 @@ class _Connection:
     """Connections to MCio mod. Used by Controller.
     Don't use this directly, use ControllerSync or ControllerAsync."""
 
+    MONITOR_POLL_MS = 100
+    # How long close() waits for queued actions to be sent
+    ACTION_LINGER_MS = 1000
+
     def __init__(
         self,
         *,
@@ -194,12 +209,14 @@ class _Connection:
 
         # Socket to send commands
         self.action_socket = self.zmq_context.socket(zmq.PUSH)
+        self.action_socket.setsockopt(zmq.LINGER, self.ACTION_LINGER_MS)
         action_monitor = self.action_socket.get_monitor_socket()
         self.action_socket.connect(f"tcp://{types.DEFAULT_HOST}:{action_port}")
         self.action_connected = threading.Event()
 
         # Socket to receive observation updates
         self.observation_socket = self.zmq_context.socket(zmq.PULL)
+        self.observation_socket.setsockopt(zmq.LINGER, 0)
         observation_monitor = self.observation_socket.get_monitor_socket()
         self.observation_socket.connect(
             f"tcp://{types.DEFAULT_HOST}:{observation_port}"
@@ -254,9 +271,13 @@ class _Connection:
             # Will only happen if ZMQ's queue is full
             LOG.error(f"ZMQ error in send_action: {e.errno}: {e}")
 
-    def recv_observation(self, block: bool = True) -> ObservationPacket | None:
+    def recv_observation(
+        self, block: bool = True, latest: bool = False
+    ) -> ObservationPacket | None:
         """
         Receives observation from zmq socket.
+        If latest is True, any observations already waiting behind the first are
+        received and only the most recent one is decoded. Older ones are discarded.
         """
         while self._running.is_set():
             try:
@@ -279,6 +300,8 @@ class _Connection:
                     pass
             else:
                 # recv returned
+                if latest:
+                    pbytes = self._recv_latest(pbytes)
                 # This may also return None if there was an unpack error.
                 observation = ObservationPacket.unpack(pbytes)
                 self._last_observation_pkt = observation
@@ -290,6 +313,21 @@ class _Connection:
         # Loop exited
         return None
 
+    def _recv_latest(self, pbytes: bytes) -> bytes:
+        """Drain the observation socket without blocking. Returns the most recent
+        packet bytes, which is pbytes if nothing else was waiting. Skips the
+        decode of observations that would just be dropped."""
+        n_dropped = 0
+        while True:
+            try:
+                pbytes = self.observation_socket.recv(zmq.DONTWAIT)
+            except (zmq.Again, zmq.ContextTerminated):
+                break
+            n_dropped += 1
+        if n_dropped > 0:
+            LOG.debug(f"Dropped {n_dropped} stale observation packets")
+        return pbytes
+
     def send_stop(self) -> None:
         """Send a stop packet to Minecraft. This should cause Minecraft to cleanly exit."""
         LOG.info("Sending-Stop")
@@ -303,6 +341,10 @@ class _Connection:
         self._running.clear()
         self.action_socket.close()
         self.observation_socket.close()
+        # The monitor thread sees _running cleared on its next poll timeout and
+        # closes the monitors. term() then waits up to ACTION_LINGER_MS for any
+        # queued actions to be sent.
+        self.monitor_thread.join(timeout=1.0)
         self.zmq_context.term()
 
     def _wait_for_connections(self, connection_timeout: float | None = None) -> bool:
@@ -362,8 +404,9 @@ class _Connection:
             # with dict() this is {socket: poll_event_mask}
             # Only care about socket here since the only event
             # we're listening for is POLLIN.
+            # Poll with a timeout so the loop notices when _running is cleared.
             try:
-                poll_events = dict(poller.poll())
+                poll_events = dict(poller.poll(self.MONITOR_POLL_MS))
             except zmq.ContextTerminated:
                 break  # exiting
 
@@ -147,6 +147,7 @@ class GuiCmd(Cmd):
             fps=args.fps,
             action_port=args.action_port,
             observation_port=args.observation_port,
+            vsync=args.vsync,
         )
         gui.run()
 
@@ -170,6 +171,11 @@ class GuiCmd(Cmd):
             help="Window scale factor",
         )
         gui_parser.add_argument("--fps", type=int, default=60, help="Set fps limit")
+        gui_parser.add_argument(
+            "--vsync",
+            action="store_true",
+            help="Pace frames to the display refresh (vsync)",
+        )
         gui_parser.add_argument(
             "--action-port",
             type=int,
@@ -111,6 +111,8 @@ class MinerlCursor(CursorDrawer):
             cursor_data = np.load(f)
         self.cursor_alpha = cursor_data[:16, :16, 3:] / 255.0
         self.cursor_image = cursor_data[:16, :16, :3] * self.cursor_alpha
+        # Precomputed so draw_cursor only does one multiply and one add
+        self.cursor_inv_alpha = 1 - self.cursor_alpha
 
     def draw_cursor(
         self,
@@ -128,12 +130,13 @@ class MinerlCursor(CursorDrawer):
         cw = min(w - x, self.cursor_image.shape[1])
 
         background = frame[y : y + ch, x : x + cw]
-        cropped_alpha = self.cursor_alpha[:ch, :cw]
+        cropped_inv_alpha = self.cursor_inv_alpha[:ch, :cw]
         cropped_image = self.cursor_image[:ch, :cw]
 
-        frame[y : y + ch, x : x + cw] = (
-            background * (1 - cropped_alpha) + cropped_image
-        ).astype(frame.dtype)
+        # Blend in one temporary. Assigning back truncates to the frame dtype.
+        blended = background * cropped_inv_alpha
+        blended += cropped_image
+        background[...] = blended
 
 
 class CrosshairCursor(CursorDrawer):
@@ -210,7 +213,8 @@ class LatestItemQueue(queue.Queue[T]):
 class TrackPerSecond:
     def __init__(self, name: str, log_time: float | None = 10.0):
         self.name = name
-        self.start = time.time()
+        # Monotonic so rates aren't thrown off by wall clock adjustments
+        self.start = time.monotonic()
         self.end = self.start
         self.item_count = 0
 
@@ -220,7 +224,7 @@ class TrackPerSecond:
 
     def count(self) -> None:
         """Increment the counter and log every log_time"""
-        self.end = time.time()
+        self.end = time.monotonic()
         self.item_count += 1
         self.log_count += 1
         if self.log_time is not None and self.end - self.log_start >= self.log_time:
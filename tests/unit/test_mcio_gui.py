@@ -0,0 +1,143 @@
+import queue
+from typing import Any, Callable
+from unittest.mock import MagicMock
+
+import pytest
+
+from mcio_ctrl import mcio_gui, network, types
+
+
+@pytest.fixture
+def gui_app(monkeypatch: pytest.MonkeyPatch) -> mcio_gui.MCioGUI:
+    monkeypatch.setattr("mcio_ctrl.gui.ImageStreamGui", MagicMock())
+    monkeypatch.setattr("mcio_ctrl.controller.ControllerAsync", MagicMock())
+    app = mcio_gui.MCioGUI()
+    assert app.gui is not None
+    app.gui.is_focused = True
+    return app
+
+
+class FakeClock:
+    """Stands in for the time module in mcio_gui. Only the test advances it."""
+
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def perf_counter(self) -> float:
+        return self.now
+
+
+@pytest.fixture
+def clock(monkeypatch: pytest.MonkeyPatch) -> FakeClock:
+    fake = FakeClock()
+    monkeypatch.setattr(mcio_gui, "time", fake)
+    return fake
+
+
+def _run_ticks(
+    app: mcio_gui.MCioGUI,
+    clock: FakeClock,
+    frames: list[bool],
+    on_wait: Callable[[float], None] | None = None,
+) -> list[float]:
+    """Run the app loop for len(frames) ticks. frames[i] says whether a new
+    observation arrives on tick i. Showing a frame takes 1/144s, like a vsync swap
+    on a 144Hz display. on_wait replaces the default of sleeping the full timeout.
+    Returns the timeouts passed to gui.wait()."""
+    gui, ctrl = app.gui, app.controller
+    assert isinstance(gui, MagicMock) and isinstance(ctrl, MagicMock)
+    ticks = iter(frames)
+    n_polls = 0
+    waits: list[float] = []
+
+    def recv_observation(block: bool = True) -> network.ObservationPacket:
+        if next(ticks):
+            return network.ObservationPacket(
+                frame=bytes(4 * 6 * 3), frame_height=4, frame_width=6
+            )
+        raise queue.Empty
+
+    def show(*args: Any, **kwargs: Any) -> None:
+        clock.now += 1 / 144
+
+    def wait(timeout: float) -> None:
+        waits.append(timeout)
+        if on_wait is not None:
+            on_wait(timeout)
+        else:
+            clock.now += timeout
+
+    def poll() -> None:
+        nonlocal n_polls
+        n_polls += 1
+        if n_polls == len(frames):
+            app.running = False
+
+    ctrl.recv_observation.side_effect = recv_observation
+    gui.show.side_effect = show
+    gui.poll.side_effect = poll
+    gui.wait.side_effect = wait
+    app.run()
+    return waits
+
+
+def _sent(app: mcio_gui.MCioGUI) -> list[network.ActionPacket]:
+    send = app.controller.send_action
+    assert isinstance(send, MagicMock)
+    return [call.args[0] for call in send.call_args_list]
+
+
+def test_pending_action_keeps_event_order(gui_app: mcio_gui.MCioGUI) -> None:
+    button = 0  # glfw.MOUSE_BUTTON_LEFT
+    press = types.InputEvent.from_ints(
+        types.InputType.MOUSE, button, types.GlfwAction.PRESS
+    )
+    release = types.InputEvent.from_ints(
+        types.InputType.MOUSE, button, types.GlfwAction.RELEASE
+    )
+
+    # move, move, click, move, release in one loop pass
+    gui_app.cursor_position_callback(None, 1, 1)
+    gui_app.cursor_position_callback(None, 2, 2)
+    gui_app.mouse_button_callback(None, button, types.GlfwAction.PRESS, 0)
+    gui_app.cursor_position_callback(None, 3, 3)
+    gui_app.mouse_button_callback(None, button, types.GlfwAction.RELEASE, 0)
+    gui_app.send_pending_action()
+
+    sent = [(pkt.inputs, pkt.cursor_pos) for pkt in _sent(gui_app)]
+    assert sent == [
+        ([], [(2, 2)]),
+        ([press], []),
+        ([], [(3, 3)]),
+        ([release], []),
+    ]
+
+
+def test_run_vsync_doesnt_build_up_deadline(
+    gui_app: mcio_gui.MCioGUI, clock: FakeClock
+) -> None:
+    # 144Hz display with the default fps=60. Each vsync-paced frame is shorter
+    # than the frame time, so the deadline must not run ahead of the clock.
+    gui_app.vsync = True
+    waits = _run_ticks(gui_app, clock, [True] * 200 + [False])
+    # The tick without a new frame waits at most one frame time
+    assert sum(waits) <= 1 / gui_app.fps + 1e-9
+
+
+def test_run_sends_cursor_moves_once_per_tick(
+    gui_app: mcio_gui.MCioGUI, clock: FakeClock
+) -> None:
+    moves = 0
+
+    def move_and_wake(timeout: float) -> None:
+        # A cursor event wakes the wait early twice, then the deadline is reached
+        nonlocal moves
+        moves += 1
+        gui_app.cursor_position_callback(None, moves, moves)
+        clock.now += timeout if moves % 3 == 0 else timeout / 2
+
+    waits = _run_ticks(gui_app, clock, [False] * 3, on_wait=move_and_wake)
+    assert len(waits) == moves == 9
+    # Moves collected while waiting go out in one packet at the next tick's poll.
+    # The last tick's moves are still pending when the loop exits.
+    assert [pkt.cursor_pos for pkt in _sent(gui_app)] == [[(3, 3)], [(6, 6)]]
@@ -4,7 +4,7 @@ from typing import Any
 
 import pytest
 
-from mcio_ctrl import types
+from mcio_ctrl import network, types
 from mcio_ctrl.envs import minerl_env
 
 
@@ -30,3 +30,20 @@ def test_minerl_is_valid(
     """Check that at least the sample from minerl is valid in the mcio minerl env."""
     assert minerl_sample["action"] in default_minerl_env.action_space
     assert minerl_sample["observation"] in default_minerl_env.observation_space
+
+
+def test_packet_to_observation_reuses_frame(
+    default_minerl_env: minerl_env.MinerlEnv,
+) -> None:
+    height, width = 4, 6
+    packet = network.ObservationPacket(
+        frame=bytes(height * width * 3), frame_height=height, frame_width=width
+    )
+    default_minerl_env._reset_state()
+    default_minerl_env._update_state(packet)
+    obs = default_minerl_env._packet_to_observation(packet)
+    frame = default_minerl_env.last_frame
+    assert frame is not None
+    assert frame.shape == (height, width, 3)
+    # pov is the frame extracted in _update_state, not a second copy
+    assert obs["pov"] is frame
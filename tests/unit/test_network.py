@@ -2,10 +2,12 @@ import time
 from typing import Any, Generator
 from unittest.mock import MagicMock
 
+import glfw  # type: ignore
+import numpy as np
 import pytest
 import zmq
 
-from mcio_ctrl import network
+from mcio_ctrl import network, types
 
 
 @pytest.fixture
@@ -63,3 +65,38 @@ def test_recv_observation(
     mock_zmq["socket"].recv.return_value = b"garbage packet"
     observation = connection.recv_observation()
     assert observation is None
+
+
+def test_recv_observation_latest(
+    mock_zmq: dict[str, MagicMock], connection: network._Connection
+) -> None:
+    pkts = [network.ObservationPacket(sequence=seq).pack() for seq in (1, 2, 3)]
+    mock_zmq["socket"].recv.side_effect = [*pkts, zmq.Again()]
+    observation = connection.recv_observation(latest=True)
+    assert observation is not None
+    assert observation.sequence == 3
+
+
+def test_get_frame_out() -> None:
+    height, width = 4, 6
+    frame = np.arange(height * width * 3, dtype=np.uint8).reshape((height, width, 3))
+    obs = network.ObservationPacket(
+        frame=np.flipud(frame).tobytes(), frame_height=height, frame_width=width
+    )
+    out = np.zeros_like(frame)
+    assert obs.get_frame(out=out) is out
+    assert np.array_equal(out, frame)
+    # Mismatched shape falls back to a new array
+    other = obs.get_frame(out=np.zeros((1, 1, 3), dtype=np.uint8))
+    assert np.array_equal(other, frame)
+
+
+def test_action_pack_round_trip() -> None:
+    key = types.InputEvent.from_ints(types.InputType.KEY, glfw.KEY_W, glfw.PRESS)
+    action = network.ActionPacket(sequence=5, inputs=[key], cursor_pos=[(1, 2)])
+    # Packing twice exercises the cached field names
+    assert action.pack() == action.pack()
+    unpacked = network.ActionPacket.unpack(action.pack())
+    assert unpacked is not None
+    assert unpacked.sequence == 5
+    assert unpacked.inputs == [key]